@@ -5,10 +5,119 @@ This module handles command-line arguments and orchestrates the search process.
 """
 
 import sys
+import time
 import argparse
-from .db_connection import get_connection
-from .search import get_all_tables, search_in_table
-from .utils import format_results, save_results_to_file, filter_and_reorder_tables
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .db_connection import ConnectionPool, StatementCanceller
+from .search import (
+    count_skipped_tables, get_all_tables, get_all_columns, get_table_row_counts,
+    make_predicate_builder, search_in_table, search_all_tables
+)
+from .utils import format_results_to, save_results_to_file
+
+# Minimum seconds between progress updates
+PROGRESS_INTERVAL = 0.1
+
+
+def positive_int(value):
+    """Parse a command-line integer that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def search_tables_parallel(pool, tables, columns_map, predicate_builder, args):
+    """
+    Search tables concurrently, printing throttled progress to stderr.
+
+    Args:
+        pool: ConnectionPool to borrow connections from
+        tables: List of table names in format 'schema.table'
+        columns_map: Searchable column info per (schema, table)
+        predicate_builder: WHERE clause builder from make_predicate_builder
+        args: Parsed command-line arguments
+
+    Returns:
+        List of matches in table order; with --stop-on-first, only those of
+        the first matching table in that order
+    """
+    # Search tables concurrently; pyodbc releases the GIL while waiting on
+    # the server, and each running search borrows its own pooled connection
+    workers = max(1, min(pool.max_size, len(tables)))
+    print(f"Searching {len(tables)} tables using {workers} worker(s)\n")
+
+    # Once --stop-on-first has its match, scans of later tables still
+    # running are cancelled on the server rather than awaited
+    canceller = StatementCanceller()
+
+    def search_table(table):
+        schema, table_name = table.split('.')
+        with pool.acquire() as conn:
+            return search_in_table(
+                canceller.track(conn),
+                schema,
+                table_name,
+                args.search_value,
+                exact_counts=args.exact_counts,
+                columns=columns_map.get((schema, table_name), []),
+                stop_on_first=args.stop_on_first,
+                predicate_builder=predicate_builder
+            )
+
+    # Search through all tables
+    table_results = [None] * len(tables)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = {executor.submit(search_table, table): i for i, table in enumerate(tables)}
+
+    last_progress = 0.0
+    # Lowest table index whose result is not yet known; with --stop-on-first
+    # only a match at this point in table order may end the search, so that
+    # an earlier table still running can't be overtaken by a later one
+    next_index = 0
+    first_match = None
+
+    try:
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            table_results[i] = future.result()
+
+            if args.stop_on_first:
+                while next_index < len(tables) and table_results[next_index] is not None:
+                    if table_results[next_index]:
+                        first_match = next_index
+                        break
+                    next_index += 1
+
+            # Progress goes to stderr at most every PROGRESS_INTERVAL so that
+            # redirected stdout stays clean and console writes stay cheap
+            now = time.monotonic()
+            if first_match is not None or done == len(tables) or now - last_progress >= PROGRESS_INTERVAL:
+                print(f"[{done}/{len(tables)}] Searched {tables[i]}...", end='\r', file=sys.stderr)
+                last_progress = now
+
+            # Stop on first match if flag is set
+            if first_match is not None:
+                print(file=sys.stderr)
+                print(f"\nFirst match found in {table_results[first_match][0]['table']}! Stopping search.")
+                del table_results[first_match + 1:]
+                break
+        else:
+            print(file=sys.stderr)
+    finally:
+        # Drop tables that have not started yet; after a first match, cancel
+        # the running ones too, then wait for their threads to return
+        for pending in futures:
+            pending.cancel()
+        if first_match is not None:
+            canceller.cancel()
+        executor.shutdown(wait=True)
+
+    # Report results in table order regardless of completion order
+    return [result for results in table_results if results for result in results]
 
 
 def main():
@@ -21,9 +130,14 @@ Examples:
   python -m TableFinder                    # Interactive mode - prompts for search value
   python -m TableFinder "John Doe"
   python -m TableFinder "12345" --exact
+  python -m TableFinder "CUST-%" --pattern
   python -m TableFinder "test" --case-sensitive --table-pattern "ny%"
   python -m TableFinder "value" --start-from "cmem" --skip-tables "cmlog"
   python -m TableFinder "value" --stop-on-first
+  python -m TableFinder "value" --min-rows 0
+  python -m TableFinder "value" --exact-counts
+  python -m TableFinder "value" --parallel 4
+  python -m TableFinder "value" --server-side
   python -m TableFinder "value" --output results.json
         """
     )
@@ -31,11 +145,17 @@ Examples:
     parser.add_argument('search_value', nargs='?', help='Value to search for (optional - will prompt if not provided)')
     parser.add_argument('--exact', action='store_true', help='Search for exact matches only')
     parser.add_argument('--case-sensitive', action='store_true', help='Case-sensitive search')
+    parser.add_argument('--pattern', action='store_true', help='Treat the search value as a SQL LIKE pattern (e.g., "ABC%%")')
     parser.add_argument('--table-pattern', help='SQL LIKE pattern to filter tables (e.g., "ny%%")')
     parser.add_argument('--start-from', help='Start searching from this table name, then continue with all others')
     parser.add_argument('--skip-tables', help='Comma-separated list of table names to skip (e.g., "cmlog,temp")')
     parser.add_argument('--fast', action='store_true', help='Fast mode - skips large/slow tables like cmlog, dofil')
+    parser.add_argument('--min-rows', type=int, default=1, metavar='N',
+                        help='Skip tables with fewer than N rows (default: 1, skipping empty tables; 0 searches all)')
     parser.add_argument('--stop-on-first', action='store_true', help='Stop searching after finding the first match')
+    parser.add_argument('--exact-counts', action='store_true', help='Count every matching row (slower; default stops at 5+)')
+    parser.add_argument('--server-side', action='store_true', help='Search the whole database in one server-side batch (no per-table progress)')
+    parser.add_argument('--parallel', type=positive_int, default=8, metavar='N', help='Number of tables to search concurrently (default: up to 8)')
     parser.add_argument('--output', help='Save results to JSON file')
 
     args = parser.parse_args()
@@ -68,6 +188,8 @@ Examples:
     print(f"Search value: '{args.search_value}'")
     print(f"Exact match: {args.exact}")
     print(f"Case sensitive: {args.case_sensitive}")
+    if args.pattern:
+        print(f"LIKE pattern: Yes")
     if args.fast:
         print(f"Fast mode: Enabled")
     if args.table_pattern:
@@ -76,71 +198,96 @@ Examples:
         print(f"Starting from table: {args.start_from}")
     if args.skip_tables:
         print(f"Skipping tables: {args.skip_tables}")
+    if args.min_rows != 1:
+        print(f"Minimum rows: {args.min_rows}")
     if args.stop_on_first:
         print(f"Stop on first match: Yes")
+    if args.exact_counts:
+        print(f"Exact match counts: Yes")
+    if args.server_side:
+        print(f"Server-side batch: Yes")
     print(f"{'='*80}\n")
 
+    # The search flags are fixed for the run, so specialize the per-column
+    # WHERE clause construction once up front
+    predicate_builder = make_predicate_builder(
+        args.search_value,
+        exact_match=args.exact,
+        case_sensitive=args.case_sensitive,
+        like_pattern=args.pattern
+    )
+
     try:
         # Connect to database
         print("Connecting to database...")
-        conn = get_connection()
+        pool = ConnectionPool(min_size=1, max_size=args.parallel)
         print("Connected successfully!\n")
 
-        # Get all tables
+        # Get all tables; skipping and start-from ordering happen server-side
         print("Fetching table list...")
-        tables = get_all_tables(conn, args.table_pattern)
-        print(f"Found {len(tables)} tables\n")
-
-        # Filter and reorder tables
-        tables, stats = filter_and_reorder_tables(
-            tables,
-            start_from=args.start_from,
-            skip_tables=args.skip_tables
-        )
-
-        # Print filter statistics
-        if stats['started_from']:
-            print(f"Starting with table '{stats['started_from']}', then continuing through all others")
-        if stats['skipped_count'] > 0:
-            print(f"Skipping {stats['skipped_count']} table(s): {', '.join(stats['skipped_tables'])}")
-
-        print(f"Searching {stats['final_count']} tables\n")
-
-        # Search through all tables
-        all_results = []
-
-        for i, table in enumerate(tables, 1):
-            schema, table_name = table.split('.')
-            print(f"[{i}/{len(tables)}] Searching {table}...", end='\r')
-
-            results = search_in_table(
+        with pool.acquire() as conn:
+            tables = get_all_tables(
                 conn,
-                schema,
-                table_name,
-                args.search_value,
-                case_sensitive=args.case_sensitive,
-                exact_match=args.exact
+                args.table_pattern,
+                skip_tables=args.skip_tables,
+                start_from=args.start_from
             )
+            columns_map = get_all_columns(conn, args.table_pattern, skip_tables=args.skip_tables)
+            skipped_count = count_skipped_tables(conn, args.table_pattern, args.skip_tables)
+            row_counts = get_table_row_counts(conn) if args.min_rows > 0 else None
+        print(f"Found {len(tables) + skipped_count} tables\n")
+        if skipped_count:
+            print(f"Skipping {skipped_count} table(s): {', '.join(args.skip_tables.split(','))}\n")
 
-            all_results.extend(results)
+        # Skip tables below --min-rows before probing any of their columns
+        if row_counts is not None:
+            searched = [
+                table for table in tables
+                if row_counts.get(tuple(table.split('.')), args.min_rows) >= args.min_rows
+            ]
+            skipped = len(tables) - len(searched)
+            if skipped and args.min_rows == 1:
+                print(f"Skipping {skipped} empty table(s)\n")
+            elif skipped:
+                print(f"Skipping {skipped} table(s) with fewer than {args.min_rows} rows\n")
+            tables = searched
 
-            # Stop on first match if flag is set
+        if args.start_from and tables and tables[0].split('.')[-1].lower() == args.start_from.lower():
+            print(f"Starting with table '{args.start_from}', then continuing through all others")
+
+        if args.server_side:
+            print(f"Searching {len(tables)} tables in server-side batches\n")
+            with pool.acquire() as conn:
+                all_results = search_all_tables(
+                    conn,
+                    tables,
+                    args.search_value,
+                    exact_counts=args.exact_counts,
+                    stop_on_first=args.stop_on_first,
+                    columns_map=columns_map,
+                    predicate_builder=predicate_builder
+                )
             if args.stop_on_first and all_results:
-                print(f"\n\nFirst match found in {table}! Stopping search.")
-                break
+                print(f"First match found in {all_results[0]['table']}! Stopping search.")
+        else:
+            all_results = search_tables_parallel(pool, tables, columns_map, predicate_builder, args)
 
         print(f"\n{'='*80}")
         print(f"Search complete!")
         print(f"{'='*80}")
 
-        # Display results
-        print(format_results(all_results, args.search_value))
+        # Display results, writing each one as it is formatted
+        format_results_to(sys.stdout, all_results, args.search_value)
+        sys.stdout.write("\n")
 
         # Save to file if requested
         if args.output:
-            save_results_to_file(all_results, args.output, args.search_value)
+            # Sample values are row data (e.g. Swedish text), so keep them
+            # readable as UTF-8 rather than \u escapes
+            save_results_to_file(all_results, args.output, args.search_value, unicode=True)
+            print(f"\nResults saved to: {args.output}")
 
-        conn.close()
+        pool.close()
 
         return 0 if all_results else 1
 
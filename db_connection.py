@@ -1,17 +1,63 @@
 """Database connection utilities for SQL Server."""
 
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional
 import pyodbc
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Let the ODBC driver manager reuse physical connections (must be set
+# before the first connection is opened)
+pyodbc.pooling = True
 
+# SQL Server ODBC drivers, best first
+PREFERRED_DRIVERS = (
+    'ODBC Driver 18 for SQL Server',
+    'ODBC Driver 17 for SQL Server',
+    'ODBC Driver 13 for SQL Server',
+    'SQL Server Native Client 11.0',
+    'SQL Server'
+)
+
+# Driver picked by _find_driver(), resolved once per process
+_driver: Optional[str] = None
+
+
+def _find_driver() -> str:
+    """
+    Pick the best installed SQL Server ODBC driver.
+
+    Returns:
+        str: Driver name from PREFERRED_DRIVERS
+
+    Raises:
+        Exception: If no suitable ODBC driver is found
+    """
+    global _driver
+    if _driver is None:
+        drivers = pyodbc.drivers()
+        installed = set(drivers)
+        _driver = next((d for d in PREFERRED_DRIVERS if d in installed), None)
+        if not _driver:
+            raise Exception(f"No suitable SQL Server ODBC driver found. Available: {drivers}")
+    return _driver
+
+
+@lru_cache(maxsize=1)
 def get_connection_string() -> str:
     """
     Build SQL Server connection string from environment variables.
 
+    The result is cached, so the environment and driver list are only read
+    on the first call.
+
     Returns:
         str: ODBC connection string
 
@@ -29,23 +75,7 @@ def get_connection_string() -> str:
         raise ValueError("Missing required environment variables. Check .env file.")
 
     # Try to find best available SQL Server ODBC driver
-    drivers = pyodbc.drivers()
-    preferred_drivers = [
-        'ODBC Driver 18 for SQL Server',
-        'ODBC Driver 17 for SQL Server',
-        'ODBC Driver 13 for SQL Server',
-        'SQL Server Native Client 11.0',
-        'SQL Server'
-    ]
-
-    driver = None
-    for pref_driver in preferred_drivers:
-        if pref_driver in drivers:
-            driver = pref_driver
-            break
-
-    if not driver:
-        raise Exception(f"No suitable SQL Server ODBC driver found. Available: {drivers}")
+    driver = _find_driver()
 
     # SQL Server connection string
     conn_str = (
@@ -79,3 +109,242 @@ def get_connection():
         for driver in pyodbc.drivers():
             print(f"  - {driver}")
         raise
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of reusable database connections.
+
+    Connections are opened on demand up to max_size and handed back to the
+    pool after use. A connection that has been idle for longer than
+    health_check_after seconds is checked with 'SELECT 1' before it is reused
+    and replaced if the server has dropped it.
+
+    Example:
+        pool = ConnectionPool(max_size=4)
+        with pool.acquire() as conn:
+            cursor = conn.cursor()
+        pool.close()
+    """
+
+    def __init__(self, min_size: int = 1, max_size: int = 8, health_check_after: float = 30.0):
+        """
+        Create the pool and open min_size connections up front.
+
+        Args:
+            min_size: Number of connections to open immediately
+            max_size: Maximum number of open connections
+            health_check_after: Idle seconds after which a connection is checked before reuse
+
+        Raises:
+            ValueError: If the size limits are inconsistent
+            pyodbc.Error: If an initial connection fails
+        """
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError(f"Invalid pool size: min_size={min_size}, max_size={max_size}")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.health_check_after = health_check_after
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._closed = False
+
+        for _ in range(min_size):
+            self._reserve()
+            self._idle.put((self._open(), time.monotonic()))
+
+    def _reserve(self) -> bool:
+        """Claim a slot for a new connection if the pool is below max_size."""
+        with self._lock:
+            if self._size >= self.max_size:
+                return False
+            self._size += 1
+            return True
+
+    def _open(self):
+        """Open a new connection in a previously reserved slot."""
+        try:
+            return get_connection()
+        except Exception:
+            with self._lock:
+                self._size -= 1
+            raise
+
+    def _discard(self, conn) -> None:
+        """Close a connection and free its slot."""
+        with self._lock:
+            self._size -= 1
+        try:
+            conn.close()
+        except pyodbc.Error:
+            pass
+
+    @staticmethod
+    def _is_healthy(conn) -> bool:
+        """Check that a connection can still run a query."""
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1").fetchone()
+            cursor.close()
+            return True
+        except pyodbc.Error:
+            return False
+
+    def _checkout(self, timeout=None):
+        """
+        Take an idle connection, open a new one, or wait for one to be released.
+
+        If opening an extra connection fails while others are open, the pool
+        shrinks its max_size to the current size and waits for one of those.
+        """
+        while True:
+            try:
+                conn, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                if self._reserve():
+                    try:
+                        return self._open()
+                    except pyodbc.Error:
+                        with self._lock:
+                            if self._size == 0:
+                                raise
+                            # The server refused another connection (e.g., a
+                            # per-login limit); stop growing and share the
+                            # connections that are already open
+                            self.max_size = self._size
+                try:
+                    conn, released_at = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError("Timed out waiting for a database connection")
+
+            if time.monotonic() - released_at < self.health_check_after or self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+    def release(self, conn) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            conn: Connection previously obtained from acquire()
+        """
+        if self._closed:
+            self._discard(conn)
+        else:
+            self._idle.put((conn, time.monotonic()))
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        """
+        Borrow a connection for the duration of a with-block.
+
+        Args:
+            timeout: Seconds to wait for a free connection (None waits forever)
+
+        Yields:
+            pyodbc.Connection: Database connection object
+
+        Raises:
+            TimeoutError: If no connection became available in time
+        """
+        conn = self._checkout(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close all idle connections; connections still in use are closed on release."""
+        self._closed = True
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+
+class StatementCanceller:
+    """
+    Cancel statements that other threads are running.
+
+    Connections wrapped with track() hand out cursors that register each
+    statement while it executes. cancel() interrupts those statements on the
+    server and makes every later execute() on a tracked cursor fail at once,
+    so a search that is no longer needed stops instead of running to the end.
+
+    Example:
+        canceller = StatementCanceller()
+        with pool.acquire() as conn:
+            search_in_table(canceller.track(conn), ...)
+        # from another thread
+        canceller.cancel()
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running = set()
+        self.cancelled = False
+
+    def track(self, conn) -> '_TrackedConnection':
+        """Wrap a connection so statements run on its cursors can be cancelled."""
+        return _TrackedConnection(conn, self)
+
+    def cancel(self) -> None:
+        """Cancel the running statements and refuse to start new ones."""
+        with self._lock:
+            self.cancelled = True
+            running = list(self._running)
+        for cursor in running:
+            try:
+                cursor.cancel()
+            except pyodbc.Error:
+                # The statement finished (or its cursor closed) in the meantime
+                pass
+
+    def _execute(self, cursor, args) -> None:
+        """Run a statement on a raw cursor, registered for cancel()."""
+        with self._lock:
+            if self.cancelled:
+                raise pyodbc.OperationalError('HY008', 'Operation canceled')
+            self._running.add(cursor)
+        try:
+            cursor.execute(*args)
+        finally:
+            with self._lock:
+                self._running.discard(cursor)
+
+
+class _TrackedConnection:
+    """Connection proxy whose cursors run statements through a StatementCanceller."""
+
+    def __init__(self, conn, canceller: StatementCanceller):
+        self._conn = conn
+        self._canceller = canceller
+
+    def cursor(self) -> '_TrackedCursor':
+        return _TrackedCursor(self._conn.cursor(), self._canceller)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class _TrackedCursor:
+    """Cursor proxy that lets a StatementCanceller interrupt execute()."""
+
+    def __init__(self, cursor, canceller: StatementCanceller):
+        object.__setattr__(self, '_cursor', cursor)
+        object.__setattr__(self, '_canceller', canceller)
+
+    def execute(self, *args) -> '_TrackedCursor':
+        self._canceller._execute(self._cursor, args)
+        return self
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        # Settings such as arraysize belong to the real cursor
+        setattr(self._cursor, name, value)
@@ -1,41 +1,246 @@
 """Search functionality for finding values across database tables."""
 
+import re
+import uuid
 import pyodbc
-from typing import List, Dict, Any, Optional
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, NamedTuple, Optional, Tuple
+from .utils import parse_skip_tables
 
+# Upper bound on bound parameters per batched query (SQL Server allows 2100)
+MAX_BATCH_PARAMS = 2000
 
-def get_all_tables(conn, table_pattern: Optional[str] = None) -> List[str]:
+# Rows fetched per round trip when reading larger result sets
+FETCH_BATCH_SIZE = 500
+
+# Number of sample values returned per matching column
+SAMPLE_LIMIT = 5
+
+
+class ColumnInfo(NamedTuple):
+    """Name and SQL data type of a table column."""
+    name: str
+    type: str
+
+
+# Column types that cannot be searched as text
+SKIP_TYPES = frozenset({'image', 'binary', 'varbinary', 'timestamp', 'rowversion', 'geography', 'geometry'})
+_SKIP_TYPES_SQL = ', '.join(f"'{t}'" for t in sorted(SKIP_TYPES))
+
+# Column metadata keyed by (schema, table). The tool never alters the schema,
+# so entries stay valid for the life of the process.
+_columns_cache: Dict[Tuple[str, str], List[ColumnInfo]] = {}
+_searchable_cache: Dict[Tuple[str, str], List[ColumnInfo]] = {}
+
+# Column type families used to pick a native, index-friendly predicate
+STRING_TYPES = frozenset({'char', 'varchar', 'nchar', 'nvarchar'})
+INTEGER_TYPES = frozenset({'bit', 'tinyint', 'smallint', 'int', 'bigint'})
+DECIMAL_TYPES = frozenset({'decimal', 'numeric', 'money', 'smallmoney', 'float', 'real'})
+ISO_DATE_TYPES = frozenset({'date', 'time', 'datetime2', 'datetimeoffset'})
+
+NUMERIC_CHARS = frozenset('0123456789+-.eE')
+DATE_CHARS = frozenset('0123456789-:. +')
+GUID_CHARS = frozenset('0123456789abcdef-{}')
+
+# LIKE metacharacters
+LIKE_WILDCARDS = frozenset('%_[')
+
+
+def _fetch_rows(cursor):
+    """
+    Yield result rows, fetching cursor.arraysize rows per round trip.
+
+    Args:
+        cursor: Database cursor with an executed query
+
+    Yields:
+        Result rows
+    """
+    while True:
+        rows = cursor.fetchmany(cursor.arraysize)
+        if not rows:
+            break
+        yield from rows
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE metacharacters so value matches literally (with ESCAPE '\\')."""
+    return re.sub(r'([\\%_\[])', r'\\\1', value)
+
+
+def _skip_tables_clause(skip_tables: Optional[str], column: str = 'TABLE_NAME') -> Tuple[str, List[str]]:
+    """
+    Build SQL conditions that exclude skipped tables.
+
+    Args:
+        skip_tables: Comma-separated list of tables to skip (supports wildcards like konv_*)
+        column: Column holding the table name
+
+    Returns:
+        Tuple of (sql, params); sql is empty if nothing is skipped
+    """
+    skip_tables_list, skip_patterns = parse_skip_tables(skip_tables)
+    skip_tables_list = [t for t in skip_tables_list if t]
+
+    sql = ""
+    params = []
+    if skip_tables_list:
+        sql += f" AND LOWER({column}) NOT IN ({', '.join('?' * len(skip_tables_list))})"
+        params.extend(skip_tables_list)
+    for prefix in skip_patterns:
+        sql += f" AND LOWER({column}) NOT LIKE ? ESCAPE '\\'"
+        params.append(_escape_like(prefix) + '%')
+
+    return sql, params
+
+
+def get_all_tables(
+    conn,
+    table_pattern: Optional[str] = None,
+    skip_tables: Optional[str] = None,
+    start_from: Optional[str] = None
+) -> List[str]:
     """
     Get all table names from the database.
 
+    Skipping and reordering happen on the server, so only the tables that
+    will be searched are transferred.
+
     Args:
         conn: Database connection
         table_pattern: Optional SQL LIKE pattern to filter tables (e.g., 'ny%')
+        skip_tables: Optional comma-separated list of tables to skip (supports wildcards like konv_*)
+        start_from: Optional table name to start from; tables before it are moved to the end
 
     Returns:
         List of table names in format 'schema.table'
     """
     cursor = conn.cursor()
+    cursor.arraysize = FETCH_BATCH_SIZE
 
     query = """
     SELECT TABLE_SCHEMA, TABLE_NAME
+    FROM INFORMATION_SCHEMA.TABLES t
+    WHERE TABLE_TYPE = 'BASE TABLE'
+    """
+    params = []
+
+    pattern_clause = ""
+    if table_pattern:
+        pattern_clause = " AND TABLE_NAME LIKE ?"
+        query += pattern_clause
+        params.append(table_pattern)
+
+    skip_clause, skip_params = _skip_tables_clause(skip_tables)
+    query += skip_clause
+    params.extend(skip_params)
+
+    if start_from:
+        # Rotate the list so it starts at the first table named start_from,
+        # matching filter_and_reorder_tables()
+        query += f"""
+    ORDER BY CASE WHEN EXISTS (
+        SELECT 1 FROM INFORMATION_SCHEMA.TABLES s
+        WHERE s.TABLE_TYPE = 'BASE TABLE'{pattern_clause}
+        AND LOWER(s.TABLE_NAME) = ?
+        AND (s.TABLE_SCHEMA < t.TABLE_SCHEMA
+             OR (s.TABLE_SCHEMA = t.TABLE_SCHEMA AND s.TABLE_NAME <= t.TABLE_NAME))
+    ) THEN 0 ELSE 1 END, TABLE_SCHEMA, TABLE_NAME"""
+        if table_pattern:
+            params.append(table_pattern)
+        params.append(start_from.lower())
+    else:
+        query += " ORDER BY TABLE_SCHEMA, TABLE_NAME"
+
+    cursor.execute(query, *params)
+    tables = [f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}" for row in _fetch_rows(cursor)]
+    cursor.close()
+
+    return tables
+
+
+def count_skipped_tables(
+    conn,
+    table_pattern: Optional[str] = None,
+    skip_tables: Optional[str] = None
+) -> int:
+    """
+    Count the base tables that the skip list excludes from get_all_tables.
+
+    The skip conditions are negated in a single COUNT(*), so reporting the
+    skipped tables never transfers their names.
+
+    Args:
+        conn: Database connection
+        table_pattern: Optional SQL LIKE pattern to filter tables (e.g., 'ny%')
+        skip_tables: Optional comma-separated list of tables to skip (supports wildcards like konv_*)
+
+    Returns:
+        Number of matching tables excluded by skip_tables
+    """
+    skip_clause, skip_params = _skip_tables_clause(skip_tables)
+    if not skip_clause:
+        return 0
+
+    query = """
+    SELECT COUNT(*)
     FROM INFORMATION_SCHEMA.TABLES
     WHERE TABLE_TYPE = 'BASE TABLE'
     """
+    params = []
 
     if table_pattern:
-        query += f" AND TABLE_NAME LIKE '{table_pattern}'"
+        query += " AND TABLE_NAME LIKE ?"
+        params.append(table_pattern)
+
+    query += f" AND NOT (1 = 1{skip_clause})"
+    params.extend(skip_params)
+
+    cursor = conn.cursor()
+    cursor.execute(query, *params)
+    skipped = cursor.fetchone()[0]
+    cursor.close()
+
+    return skipped
+
+
+def get_table_row_counts(conn) -> Dict[Tuple[str, str], int]:
+    """
+    Get the row count of every user table in a single query.
+
+    Counts come from partition metadata (heap or clustered index), so no
+    table is scanned; they can lag slightly behind in-flight changes.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Dict mapping (schema, table) to its row count
+    """
+    cursor = conn.cursor()
+    cursor.arraysize = FETCH_BATCH_SIZE
 
-    query += " ORDER BY TABLE_SCHEMA, TABLE_NAME"
+    query = """
+    SELECT s.name AS TABLE_SCHEMA, t.name AS TABLE_NAME, SUM(p.rows) AS ROW_COUNT
+    FROM sys.partitions p
+    JOIN sys.tables t ON p.object_id = t.object_id
+    JOIN sys.schemas s ON t.schema_id = s.schema_id
+    WHERE p.index_id IN (0, 1)
+    GROUP BY s.name, t.name
+    """
 
     cursor.execute(query)
-    tables = [f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}" for row in cursor.fetchall()]
+    row_counts = {
+        (row.TABLE_SCHEMA, row.TABLE_NAME): row.ROW_COUNT
+        for row in _fetch_rows(cursor)
+    }
     cursor.close()
 
-    return tables
+    return row_counts
 
 
-def get_table_columns(conn, schema: str, table: str) -> List[Dict[str, str]]:
+def get_table_columns(conn, schema: str, table: str) -> List[ColumnInfo]:
     """
     Get all columns for a specific table.
 
@@ -45,9 +250,14 @@ def get_table_columns(conn, schema: str, table: str) -> List[Dict[str, str]]:
         table: Table name
 
     Returns:
-        List of dicts with column info: {'name': str, 'type': str}
+        List of ColumnInfo(name, type) tuples, with lowercase type names
     """
+    key = (schema, table)
+    if key in _columns_cache:
+        return _columns_cache[key]
+
     cursor = conn.cursor()
+    cursor.arraysize = FETCH_BATCH_SIZE
 
     query = """
     SELECT COLUMN_NAME, DATA_TYPE
@@ -58,14 +268,110 @@ def get_table_columns(conn, schema: str, table: str) -> List[Dict[str, str]]:
 
     cursor.execute(query, schema, table)
     columns = [
-        {'name': row.COLUMN_NAME, 'type': row.DATA_TYPE}
-        for row in cursor.fetchall()
+        ColumnInfo(row.COLUMN_NAME, row.DATA_TYPE.lower())
+        for row in _fetch_rows(cursor)
     ]
     cursor.close()
 
+    _columns_cache[key] = columns
     return columns
 
 
+def get_all_columns(
+    conn,
+    table_pattern: Optional[str] = None,
+    skip_tables: Optional[str] = None
+) -> Dict[Tuple[str, str], List[ColumnInfo]]:
+    """
+    Get the searchable columns of every base table in a single query.
+
+    Columns of unsearchable types (see SKIP_TYPES) are filtered out by the
+    server, so they never cross the wire. Tables without any searchable
+    column are absent from the result.
+
+    Args:
+        conn: Database connection
+        table_pattern: Optional SQL LIKE pattern to filter tables (e.g., 'ny%')
+        skip_tables: Optional comma-separated list of tables to skip (supports wildcards like konv_*)
+
+    Returns:
+        Dict mapping (schema, table) to a list of ColumnInfo(name, type)
+        tuples with lowercase type names, in ordinal order
+    """
+    cursor = conn.cursor()
+    cursor.arraysize = FETCH_BATCH_SIZE
+
+    query = f"""
+    SELECT c.TABLE_SCHEMA, c.TABLE_NAME, c.COLUMN_NAME, c.DATA_TYPE
+    FROM INFORMATION_SCHEMA.COLUMNS c
+    JOIN INFORMATION_SCHEMA.TABLES t
+        ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+    WHERE t.TABLE_TYPE = 'BASE TABLE'
+    AND c.DATA_TYPE NOT IN ({_SKIP_TYPES_SQL})
+    """
+    params = []
+
+    if table_pattern:
+        query += " AND t.TABLE_NAME LIKE ?"
+        params.append(table_pattern)
+
+    skip_clause, skip_params = _skip_tables_clause(skip_tables, column='t.TABLE_NAME')
+    query += skip_clause
+    params.extend(skip_params)
+
+    query += " ORDER BY c.TABLE_SCHEMA, c.TABLE_NAME, c.ORDINAL_POSITION"
+
+    cursor.execute(query, *params)
+    columns_map = {}
+    for row in _fetch_rows(cursor):
+        columns_map.setdefault((row.TABLE_SCHEMA, row.TABLE_NAME), []).append(
+            ColumnInfo(row.COLUMN_NAME, row.DATA_TYPE.lower())
+        )
+    cursor.close()
+
+    _searchable_cache.update(columns_map)
+    return columns_map
+
+
+def get_searchable_columns(
+    conn,
+    schema: str,
+    table: str,
+    columns: Optional[List[ColumnInfo]] = None
+) -> List[ColumnInfo]:
+    """
+    Get the columns of a table whose type can be searched.
+
+    Columns looked up here are cached per table, so the metadata query and
+    type filter run once per table per process. An explicit columns list is
+    filtered as given and never cached, so it always wins over the cache.
+
+    Args:
+        conn: Database connection
+        schema: Table schema name
+        table: Table name
+        columns: Column info for the table; fetched with get_table_columns if not given
+
+    Returns:
+        List of ColumnInfo(name, type) tuples
+    """
+    if columns is not None:
+        return [col for col in columns if col.type not in SKIP_TYPES]
+
+    key = (schema, table)
+    if key not in _searchable_cache:
+        _searchable_cache[key] = [
+            col for col in get_table_columns(conn, schema, table) if col.type not in SKIP_TYPES
+        ]
+    return _searchable_cache[key]
+
+
+def clear_column_cache() -> None:
+    """Forget cached column metadata, e.g. after connecting to another database."""
+    _columns_cache.clear()
+    _searchable_cache.clear()
+
+
 def should_skip_column(data_type: str) -> bool:
     """
     Determine if a column type should be skipped for search.
@@ -76,8 +382,343 @@ def should_skip_column(data_type: str) -> bool:
     Returns:
         True if column should be skipped, False otherwise
     """
-    skip_types = ['image', 'binary', 'varbinary', 'timestamp', 'rowversion', 'geography', 'geometry']
-    return data_type.lower() in skip_types
+    return data_type.lower() in SKIP_TYPES
+
+
+def _parse_number(value: str) -> Optional[Decimal]:
+    """Parse a search value as a finite number, or return None."""
+    try:
+        number = Decimal(value.strip())
+    except InvalidOperation:
+        return None
+    return number if number.is_finite() else None
+
+
+def rewrite_like_pattern(pattern: str) -> Tuple[str, Tuple[Any, ...]]:
+    """
+    Rewrite a LIKE pattern into the cheapest equivalent comparison.
+
+    Runs of '%' are collapsed and a pattern without wildcards becomes an
+    equality test. A literal prefix followed by '%' stays a LIKE: SQL Server
+    already seeks such patterns in the column's own collation, while a
+    hand-built range could skip true matches in collations that sort
+    letters together (e.g. 'v' and 'w' in Finnish_Swedish_CI_AS).
+
+    Args:
+        pattern: SQL LIKE pattern
+
+    Returns:
+        Tuple of (operator, params) where operator is '=' or 'LIKE'
+    """
+    pattern = re.sub(r'%{2,}', '%', pattern)
+
+    if not LIKE_WILDCARDS & set(pattern):
+        return '=', (pattern,)
+
+    return 'LIKE', (pattern,)
+
+
+# Maps (column name, data type) to (where_clause, params), or None to skip
+PredicateBuilder = Callable[[str, str], Optional[Tuple[str, Tuple[Any, ...]]]]
+
+
+@lru_cache(maxsize=32)
+def make_predicate_builder(
+    search_value: str,
+    exact_match: bool = False,
+    case_sensitive: bool = False,
+    like_pattern: bool = False
+) -> PredicateBuilder:
+    """
+    Specialize predicate building for one search configuration.
+
+    The search flags are fixed for a whole run, so every decision that does
+    not depend on the column is made here, once: each known data type maps
+    straight to a WHERE template and its params (or to None when the type
+    cannot hold the search value). The returned builder is a dict lookup and
+    a single format call per column.
+
+    Args:
+        search_value: Value to search for
+        exact_match: Whether to search for exact matches only
+        case_sensitive: Whether to perform case-sensitive search
+        like_pattern: Whether search_value is a LIKE pattern rather than a substring
+
+    Returns:
+        Function taking (col_name, data_type) and returning
+        (where_clause, params), or None if the column should be skipped
+    """
+    collation = '' if case_sensitive else ' COLLATE Latin1_General_CI_AS'
+
+    if exact_match:
+        operator, params = '=', (search_value,)
+        literals = set(search_value)
+    else:
+        pattern = search_value if like_pattern else f"%{search_value}%"
+        operator, params = rewrite_like_pattern(pattern)
+        # Characters every match must contain; unknown if the pattern has a [set]
+        literals = None if '[' in pattern else set(pattern) - LIKE_WILDCARDS
+
+    # WHERE templates take the column name as {col}. An explicit COLLATE on a
+    # char/varchar column converts it to Latin1's code page, turning
+    # characters it cannot map into '?', so text columns are converted to
+    # Unicode before collating; only a case-sensitive search, which adds no
+    # COLLATE, compares them as stored (and can use an index on them)
+    text = f"CAST([{{col}}] AS NVARCHAR(MAX)){collation}"
+    column = "[{col}]" if case_sensitive else text
+    string_where = f"{column} {operator} ?"
+
+    # Fall back to comparing the column as text
+    cast = (f"{text} {operator} ?", params)
+
+    # A number rendered as text only contains digits, sign, point and exponent
+    numeric_text = literals is None or literals <= NUMERIC_CHARS
+    # ISO 8601 dates and times have no month names or AM/PM
+    iso_date_text = literals is None or literals <= DATE_CHARS
+    guid_text = literals is None or {c.lower() for c in literals} <= GUID_CHARS
+
+    def native(params):
+        return None if params is None else ("[{col}] = ?", params)
+
+    plans = dict.fromkeys(SKIP_TYPES)
+    plans.update(dict.fromkeys(STRING_TYPES, (string_where, params)))
+    if exact_match:
+        int_params = decimal_params = guid_params = None
+        number = _parse_number(search_value)
+        if number is not None:
+            decimal_params = (number,)
+            if number == number.to_integral_value():
+                int_params = (int(number),)
+        try:
+            guid_params = (str(uuid.UUID(search_value)),)
+        except ValueError:
+            pass
+
+        plans.update(dict.fromkeys(INTEGER_TYPES, native(int_params)))
+        plans.update(dict.fromkeys(DECIMAL_TYPES, native(decimal_params)))
+    else:
+        plans.update(dict.fromkeys(INTEGER_TYPES | DECIMAL_TYPES, cast if numeric_text else None))
+    plans.update(dict.fromkeys(ISO_DATE_TYPES, cast if iso_date_text else None))
+    if not guid_text:
+        plans['uniqueidentifier'] = None
+    else:
+        plans['uniqueidentifier'] = native(guid_params) if exact_match else cast
+
+    def build(col_name: str, data_type: str) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+        if data_type not in plans:
+            data_type = data_type.lower()
+        plan = plans.get(data_type, cast)
+        if plan is None:
+            return None
+        template, params = plan
+        return template.format(col=col_name), params
+
+    return build
+
+
+def build_predicate(
+    col_name: str,
+    data_type: str,
+    search_value: str,
+    exact_match: bool = False,
+    case_sensitive: bool = False,
+    like_pattern: bool = False
+) -> Optional[Tuple[str, Tuple[Any, ...]]]:
+    """
+    Build a WHERE clause for searching a single column.
+
+    Exact searches compare numeric and GUID columns in their native type, and
+    case-sensitive searches compare text columns as stored, so SQL Server can
+    use an index; other columns are cast to NVARCHAR(MAX) first.
+    Columns whose type cannot possibly hold the search value are skipped.
+    Use make_predicate_builder directly when building many predicates for
+    the same search.
+
+    Args:
+        col_name: Column name
+        data_type: SQL data type name
+        search_value: Value to search for
+        exact_match: Whether to search for exact matches only
+        case_sensitive: Whether to perform case-sensitive search
+        like_pattern: Whether search_value is a LIKE pattern rather than a substring
+
+    Returns:
+        Tuple of (where_clause, params), or None if the column should be skipped
+    """
+    builder = make_predicate_builder(search_value, exact_match, case_sensitive, like_pattern)
+    return builder(col_name, data_type)
+
+
+def _execute_batched(cursor, branches: List[Tuple[str, Tuple[Any, ...]]]) -> List[Any]:
+    """
+    Execute per-column SELECT branches as a single UNION ALL query.
+
+    If the combined query fails, the batch is split in half and each half is
+    retried, so a problematic column (e.g., a conversion error) is isolated in
+    a few round trips without hiding matches in the rest of the table.
+
+    Args:
+        cursor: Database cursor
+        branches: List of (sql, params) tuples, one per column
+
+    Returns:
+        Combined list of result rows from all branches
+    """
+    rows = []
+
+    # Split oversized batches to stay under the parameter limit
+    param_count = 0
+    for i, (_, params) in enumerate(branches):
+        param_count += len(params)
+        if param_count > MAX_BATCH_PARAMS and i > 0:
+            rows.extend(_execute_batched(cursor, branches[:i]))
+            rows.extend(_execute_batched(cursor, branches[i:]))
+            return rows
+
+    query = " UNION ALL ".join(
+        f"SELECT * FROM ({sql}) AS c{i}" for i, (sql, _) in enumerate(branches)
+    )
+
+    try:
+        cursor.execute(query, *[param for _, params in branches for param in params])
+        return list(_fetch_rows(cursor))
+    except pyodbc.Error:
+        if len(branches) == 1:
+            # Skip columns that cause errors (e.g., conversion issues)
+            return rows
+
+    middle = len(branches) // 2
+    rows.extend(_execute_batched(cursor, branches[:middle]))
+    rows.extend(_execute_batched(cursor, branches[middle:]))
+    return rows
+
+
+# How each type is rendered as a sample value. A plain CAST to NVARCHAR prints
+# datetimes as 'Jan  1 2020 12:00AM', keeps only two money decimals and turns
+# bits into 1/0, so those types use a CONVERT style (or spell the value out)
+# that every supported server version accepts. A sample expression that fails
+# would hide the column's matches, so float and real keep the plain CAST
+# (six significant digits, e.g. 1.23457e+006) rather than the 2016+ only
+# full-precision style.
+_DEFAULT_SAMPLE = "CAST([{col}] AS NVARCHAR(MAX))"
+_SAMPLE_EXPRESSIONS = {
+    'bit': "CASE [{col}] WHEN 1 THEN N'True' WHEN 0 THEN N'False' END",
+    'money': "CONVERT(NVARCHAR(MAX), [{col}], 2)",
+    'smallmoney': "CONVERT(NVARCHAR(MAX), [{col}], 2)",
+    'uniqueidentifier': "LOWER(CAST([{col}] AS NVARCHAR(MAX)))",
+    **dict.fromkeys(
+        ('date', 'time', 'datetime', 'datetime2', 'smalldatetime', 'datetimeoffset'),
+        "CONVERT(NVARCHAR(MAX), [{col}], 121)"
+    ),
+}
+
+
+def _sample_expression(column: ColumnInfo) -> str:
+    """Build the SQL expression that renders a column value as sample text."""
+    return _SAMPLE_EXPRESSIONS.get(column.type, _DEFAULT_SAMPLE).format(col=column.name)
+
+
+# Query templates, filled in per column with .format(). The sample query
+# fetches one row past the sample limit so we can tell "5" from "5+"
+# without scanning every matching row for a COUNT(*).
+_SAMPLE_QUERY = (
+    f"SELECT TOP {SAMPLE_LIMIT + 1} {{idx}} AS probe_idx, "
+    "{sample} AS sample_value FROM {table} WHERE {where}"
+)
+_COUNT_QUERY = "SELECT {idx} AS probe_idx, COUNT(*) AS match_count FROM {table} WHERE {where}"
+_SERVER_BATCH_PROBE = (
+    "BEGIN TRY "
+    f"INSERT INTO #tf_hits SELECT TOP {SAMPLE_LIMIT + 1} {{idx}}, "
+    "{sample} FROM {table} WHERE {where}; "
+    "END TRY BEGIN CATCH END CATCH;"
+)
+_SERVER_BATCH_COUNTED_PROBE = (
+    "BEGIN TRY "
+    f"INSERT INTO #tf_hits SELECT TOP {SAMPLE_LIMIT + 1} {{idx}}, "
+    "{sample} FROM {table} WHERE {where}; "
+    "IF @@ROWCOUNT > 0 INSERT INTO #tf_counts SELECT {idx}, COUNT_BIG(*) FROM {table} WHERE {where}; "
+    "END TRY BEGIN CATCH END CATCH;"
+)
+
+
+def _plan_probes(
+    full_table_name: str,
+    columns: List[ColumnInfo],
+    predicate_builder: PredicateBuilder
+) -> List[Tuple[str, ColumnInfo, str, Tuple[Any, ...]]]:
+    """
+    Build the per-column probes for a table.
+
+    Returns:
+        List of (full_table_name, column, where_clause, params) tuples, one
+        per column that can hold the search value
+    """
+    probes = []
+    for column in columns:
+        predicate = predicate_builder(column.name, column.type)
+        if predicate is not None:
+            where_clause, search_params = predicate
+            probes.append((full_table_name, column, where_clause, search_params))
+    return probes
+
+
+def _add_sample(matches: Dict[int, Dict[str, Any]], probe_idx: int, probe, sample_value) -> None:
+    """Record a sample row for a probe, creating its result entry on first sight."""
+    if probe_idx not in matches:
+        full_table_name, column, _, _ = probe
+        matches[probe_idx] = {
+            'table': full_table_name,
+            'column': column.name,
+            'data_type': column.type,
+            'match_count': 0,
+            'more_matches': False,
+            'sample_values': []
+        }
+    match = matches[probe_idx]
+    if len(match['sample_values']) < SAMPLE_LIMIT:
+        match['sample_values'].append(sample_value if sample_value is not None else 'NULL')
+        match['match_count'] += 1
+    else:
+        match['more_matches'] = True
+
+
+def _run_probes(cursor, probes, exact_counts: bool = False) -> Dict[int, Dict[str, Any]]:
+    """
+    Run probes as batched SELECT queries.
+
+    Returns:
+        Dict mapping probe index to its result entry, for probes that matched
+    """
+    branches = [
+        (
+            _SAMPLE_QUERY.format(
+                idx=probe_idx, sample=_sample_expression(column), table=full_table_name,
+                where=where_clause
+            ),
+            search_params
+        )
+        for probe_idx, (full_table_name, column, where_clause, search_params) in enumerate(probes)
+    ]
+
+    matches = {}
+    for probe_idx, sample_value in _execute_batched(cursor, branches):
+        _add_sample(matches, probe_idx, probes[probe_idx], sample_value)
+
+    # Only columns that are known to match pay for a full COUNT(*)
+    if exact_counts and matches:
+        count_branches = []
+        for probe_idx in matches:
+            full_table_name, _, where_clause, search_params = probes[probe_idx]
+            count_branches.append((
+                _COUNT_QUERY.format(idx=probe_idx, table=full_table_name, where=where_clause),
+                search_params
+            ))
+
+        for probe_idx, match_count in _execute_batched(cursor, count_branches):
+            matches[probe_idx]['match_count'] = match_count
+            matches[probe_idx]['more_matches'] = False
+
+    return matches
 
 
 def search_in_table(
@@ -86,11 +727,25 @@ def search_in_table(
     table: str,
     search_value: str,
     case_sensitive: bool = False,
-    exact_match: bool = False
+    exact_match: bool = False,
+    exact_counts: bool = False,
+    like_pattern: bool = False,
+    columns: Optional[List[ColumnInfo]] = None,
+    stop_on_first: bool = False,
+    predicate_builder: Optional[PredicateBuilder] = None
 ) -> List[Dict[str, Any]]:
     """
     Search for a value in all searchable columns of a table.
 
+    All columns are probed with a single batched query, so a table costs one
+    round trip regardless of how many columns it has. Match counts are capped
+    at the sample limit (flagged with 'more_matches') unless exact_counts is
+    set, in which case matching columns are counted with a second query.
+
+    With stop_on_first, the columns are instead probed one after another in a
+    server-side batch that stops at the first matching column, so columns
+    after a hit are never scanned.
+
     Args:
         conn: Database connection
         schema: Table schema name
@@ -98,77 +753,189 @@ def search_in_table(
         search_value: Value to search for
         case_sensitive: Whether to perform case-sensitive search
         exact_match: Whether to search for exact matches only
+        exact_counts: Whether to count every matching row
+        like_pattern: Whether search_value is a LIKE pattern rather than a substring
+        columns: Column info for the table (e.g., from get_all_columns);
+            fetched with get_table_columns if not given
+        stop_on_first: Whether to stop after the first matching column
+        predicate_builder: Prebuilt make_predicate_builder result; when given,
+            it replaces search_value, case_sensitive, exact_match and like_pattern
 
     Returns:
         List of matches with table, column, and sample matched values
     """
+    if predicate_builder is None:
+        predicate_builder = make_predicate_builder(search_value, exact_match, case_sensitive, like_pattern)
+
     results = []
 
     try:
-        columns = get_table_columns(conn, schema, table)
-        searchable_columns = [col for col in columns if not should_skip_column(col['type'])]
+        columns = get_searchable_columns(conn, schema, table, columns)
+        probes = _plan_probes(f"[{schema}].[{table}]", columns, predicate_builder)
 
-        if not searchable_columns:
+        if not probes:
             return results
 
         cursor = conn.cursor()
-        full_table_name = f"[{schema}].[{table}]"
-
-        for column in searchable_columns:
-            col_name = column['name']
-
-            # Build search query with CAST to handle different data types
-            if exact_match:
-                if case_sensitive:
-                    where_clause = f"CAST([{col_name}] AS NVARCHAR(MAX)) = ?"
-                else:
-                    where_clause = f"CAST([{col_name}] AS NVARCHAR(MAX)) COLLATE Latin1_General_CI_AS = ?"
-            else:
-                if case_sensitive:
-                    where_clause = f"CAST([{col_name}] AS NVARCHAR(MAX)) LIKE ?"
-                    search_param = f"%{search_value}%"
-                else:
-                    where_clause = f"CAST([{col_name}] AS NVARCHAR(MAX)) COLLATE Latin1_General_CI_AS LIKE ?"
-                    search_param = f"%{search_value}%"
-
-            # First check if any rows match
-            count_query = f"SELECT COUNT(*) FROM {full_table_name} WHERE {where_clause}"
-
-            try:
-                if exact_match:
-                    cursor.execute(count_query, search_value)
-                else:
-                    cursor.execute(count_query, search_param)
-
-                count = cursor.fetchone()[0]
-
-                if count > 0:
-                    # Get sample values (limit to 5 examples)
-                    sample_query = f"SELECT TOP 5 [{col_name}] FROM {full_table_name} WHERE {where_clause}"
-
-                    if exact_match:
-                        cursor.execute(sample_query, search_value)
-                    else:
-                        cursor.execute(sample_query, search_param)
-
-                    sample_values = [str(row[0]) if row[0] is not None else 'NULL' for row in cursor.fetchall()]
-
-                    results.append({
-                        'table': full_table_name,
-                        'column': col_name,
-                        'data_type': column['type'],
-                        'match_count': count,
-                        'sample_values': sample_values
-                    })
-
-            except pyodbc.Error:
-                # Skip columns that cause errors (e.g., conversion issues)
-                pass
-
+        cursor.arraysize = FETCH_BATCH_SIZE
+        if stop_on_first:
+            matches = _run_server_batches(cursor, probes, exact_counts=exact_counts, stop_on_first=True)
+        else:
+            matches = _run_probes(cursor, probes, exact_counts=exact_counts)
         cursor.close()
 
+        results = [matches[probe_idx] for probe_idx in sorted(matches)]
+
     except pyodbc.Error:
         # Skip tables that cause errors
         pass
 
     return results
+
+
+def _server_batch_sql(probes, offset: int, exact_counts: bool, stop_on_first: bool) -> str:
+    """
+    Build a T-SQL batch that runs every probe server-side into a temp table.
+
+    Each probe runs in its own TRY/CATCH so an error (e.g., a conversion
+    issue) only skips that column.
+    """
+    statements = [
+        "SET NOCOUNT ON;",
+        "IF OBJECT_ID('tempdb..#tf_hits') IS NOT NULL DROP TABLE #tf_hits;",
+        "IF OBJECT_ID('tempdb..#tf_counts') IS NOT NULL DROP TABLE #tf_counts;",
+        "CREATE TABLE #tf_hits (probe_idx INT NOT NULL, sample_value NVARCHAR(MAX) NULL);",
+        "CREATE TABLE #tf_counts (probe_idx INT NOT NULL, match_count BIGINT NOT NULL);",
+    ]
+
+    template = _SERVER_BATCH_COUNTED_PROBE if exact_counts else _SERVER_BATCH_PROBE
+    if stop_on_first:
+        template = f"IF NOT EXISTS (SELECT 1 FROM #tf_hits) BEGIN {template} END;"
+
+    for probe_idx, (full_table_name, column, where_clause, _) in enumerate(probes, offset):
+        statements.append(template.format(
+            idx=probe_idx, sample=_sample_expression(column), table=full_table_name,
+            where=where_clause
+        ))
+
+    statements.append(
+        "SELECT h.probe_idx, h.sample_value, c.match_count FROM #tf_hits h "
+        "LEFT JOIN #tf_counts c ON c.probe_idx = h.probe_idx;"
+    )
+    return "\n".join(statements)
+
+
+def _run_server_batches(
+    cursor,
+    probes,
+    exact_counts: bool = False,
+    stop_on_first: bool = False
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Run probes as server-side T-SQL batches, splitting by parameter count.
+
+    With stop_on_first, probes after the first hit are skipped on the server
+    and no further batches are sent.
+
+    Returns:
+        Dict mapping probe index to its result entry, for probes that matched
+    """
+    matches = {}
+
+    # Each probe's parameters appear twice in the batch when counting
+    uses = 2 if exact_counts else 1
+    start = 0
+    while start < len(probes) and not (stop_on_first and matches):
+        end = start
+        param_count = 0
+        while end < len(probes) and (end == start or param_count + len(probes[end][3]) * uses <= MAX_BATCH_PARAMS):
+            param_count += len(probes[end][3]) * uses
+            end += 1
+        chunk = probes[start:end]
+
+        params = []
+        for _, _, _, search_params in chunk:
+            params.extend(search_params * uses)
+
+        try:
+            cursor.execute(_server_batch_sql(chunk, start, exact_counts, stop_on_first), *params)
+            for probe_idx, sample_value, match_count in _fetch_rows(cursor):
+                _add_sample(matches, probe_idx, probes[probe_idx], sample_value)
+                if match_count is not None:
+                    matches[probe_idx]['match_count'] = match_count
+                    matches[probe_idx]['more_matches'] = False
+        except pyodbc.Error:
+            # Fall back to plain batched SELECTs for this chunk
+            fallback = _run_probes(cursor, chunk, exact_counts=exact_counts)
+            if stop_on_first and fallback:
+                # Rows arrive in no particular order; keep the first column
+                first = min(fallback)
+                fallback = {first: fallback[first]}
+            for probe_idx, match in fallback.items():
+                matches[start + probe_idx] = match
+
+        start = end
+
+    return matches
+
+
+def search_all_tables(
+    conn,
+    tables: List[str],
+    search_value: str,
+    case_sensitive: bool = False,
+    exact_match: bool = False,
+    exact_counts: bool = False,
+    like_pattern: bool = False,
+    stop_on_first: bool = False,
+    columns_map: Optional[Dict[Tuple[str, str], List[ColumnInfo]]] = None,
+    predicate_builder: Optional[PredicateBuilder] = None
+) -> List[Dict[str, Any]]:
+    """
+    Search every table at once with server-side batches.
+
+    All (table, column) probes are sent as one T-SQL batch that collects hits
+    into a temp table, so the whole database costs a single round trip (one
+    per MAX_BATCH_PARAMS parameters for very large schemas) instead of one per
+    table. There is no per-table progress in this mode.
+
+    Args:
+        conn: Database connection
+        tables: List of table names in format 'schema.table'
+        search_value: Value to search for
+        case_sensitive: Whether to perform case-sensitive search
+        exact_match: Whether to search for exact matches only
+        exact_counts: Whether to count every matching row
+        like_pattern: Whether search_value is a LIKE pattern rather than a substring
+        stop_on_first: Whether to stop after the first matching column
+        columns_map: Searchable column info per (schema, table), e.g. from
+            get_all_columns; fetched per table if not given
+        predicate_builder: Prebuilt make_predicate_builder result; when given,
+            it replaces search_value, case_sensitive, exact_match and like_pattern
+
+    Returns:
+        List of matches with table, column, and sample matched values
+    """
+    if predicate_builder is None:
+        predicate_builder = make_predicate_builder(search_value, exact_match, case_sensitive, like_pattern)
+
+    probes = []
+    for table in tables:
+        schema, table_name = table.split('.')
+        try:
+            # Tables missing from the map have no searchable columns
+            columns = get_searchable_columns(
+                conn, schema, table_name,
+                None if columns_map is None else columns_map.get((schema, table_name), [])
+            )
+        except pyodbc.Error:
+            # Skip tables that cause errors
+            continue
+        probes.extend(_plan_probes(f"[{schema}].[{table_name}]", columns, predicate_builder))
+
+    cursor = conn.cursor()
+    cursor.arraysize = FETCH_BATCH_SIZE
+    matches = _run_server_batches(cursor, probes, exact_counts=exact_counts, stop_on_first=stop_on_first)
+    cursor.close()
+
+    return [matches[probe_idx] for probe_idx in sorted(matches)]
@@ -0,0 +1,15 @@
+"""
+Shared test setup.
+
+The package modules use relative imports, so the checkout is made importable
+as the TableFinder package whatever its directory is called, the same way
+table_finder.py does.
+"""
+
+import importlib
+import os
+import sys
+
+_package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(_package_dir))
+sys.modules.setdefault('TableFinder', importlib.import_module(os.path.basename(_package_dir)))
@@ -0,0 +1,223 @@
+"""Tests for the SQL generation and batching in search.py."""
+
+import re
+from decimal import Decimal
+from itertools import product
+
+import pyodbc
+import pytest
+
+from TableFinder import search
+from TableFinder.search import (
+    DECIMAL_TYPES, INTEGER_TYPES, ISO_DATE_TYPES, MAX_BATCH_PARAMS, SKIP_TYPES, STRING_TYPES,
+    _execute_batched, make_predicate_builder, rewrite_like_pattern
+)
+
+GUID = '6F9619FF-8B86-D011-B42D-00C04FC964FF'
+FLAGS = list(product([False, True], repeat=3))
+
+
+class FakeCursor:
+    """Cursor that answers UNION ALL probe batches, failing on chosen branches."""
+
+    def __init__(self, bad_branches=()):
+        self.bad_branches = set(bad_branches)
+        self.executed = []
+        self.arraysize = 1
+        self._rows = []
+
+    def execute(self, query, *params):
+        self.executed.append((query, params))
+        branches = [int(idx) for idx in re.findall(r'\(SELECT (\d+) AS probe_idx', query)]
+        if self.bad_branches & set(branches):
+            raise pyodbc.Error('Conversion failed')
+        self._rows = [(idx,) for idx in branches]
+        return self
+
+    def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+
+def make_branches(count, params_per_branch=1):
+    return [
+        (f"SELECT {i} AS probe_idx FROM [dbo].[t] WHERE [c{i}] = ?", ('x',) * params_per_branch)
+        for i in range(count)
+    ]
+
+
+# _execute_batched
+
+def test_execute_batched_runs_one_query_when_all_branches_succeed():
+    cursor = FakeCursor()
+    rows = _execute_batched(cursor, make_branches(40))
+
+    assert rows == [(i,) for i in range(40)]
+    assert len(cursor.executed) == 1
+    assert cursor.executed[0][0].count(' UNION ALL ') == 39
+
+
+def test_execute_batched_isolates_a_failing_branch_by_bisection():
+    cursor = FakeCursor(bad_branches={17})
+    rows = _execute_batched(cursor, make_branches(40))
+
+    assert rows == [(i,) for i in range(40) if i != 17]
+    # One bad column costs about log2(N) retries, not one query per column
+    assert len(cursor.executed) == 11
+
+
+def test_execute_batched_skips_every_failing_branch():
+    cursor = FakeCursor(bad_branches={0, 5, 39})
+    rows = _execute_batched(cursor, make_branches(40))
+
+    assert rows == [(i,) for i in range(40) if i not in (0, 5, 39)]
+    assert len(cursor.executed) < 40
+
+
+def test_execute_batched_splits_batches_at_the_parameter_limit():
+    cursor = FakeCursor()
+    branches = make_branches(MAX_BATCH_PARAMS, params_per_branch=3)
+    rows = _execute_batched(cursor, branches)
+
+    assert rows == [(i,) for i in range(len(branches))]
+    assert len(cursor.executed) > 1
+    assert all(len(params) <= MAX_BATCH_PARAMS for _, params in cursor.executed)
+    assert sum(len(params) for _, params in cursor.executed) == 3 * len(branches)
+
+
+def test_execute_batched_runs_a_single_oversized_branch():
+    cursor = FakeCursor()
+    rows = _execute_batched(cursor, make_branches(1, params_per_branch=MAX_BATCH_PARAMS + 1))
+
+    assert rows == [(0,)]
+    assert len(cursor.executed) == 1
+
+
+# rewrite_like_pattern
+
+@pytest.mark.parametrize('pattern, expected', [
+    ('abc', ('=', ('abc',))),
+    ('', ('=', ('',))),
+    ('%abc%', ('LIKE', ('%abc%',))),
+    ('%%abc%%%', ('LIKE', ('%abc%',))),
+    ('abc%', ('LIKE', ('abc%',))),
+    ('V%', ('LIKE', ('V%',))),
+    ('a_c', ('LIKE', ('a_c',))),
+    ('[ab]c', ('LIKE', ('[ab]c',))),
+    ('%', ('LIKE', ('%',))),
+])
+def test_rewrite_like_pattern(pattern, expected):
+    assert rewrite_like_pattern(pattern) == expected
+
+
+# make_predicate_builder
+
+def test_make_predicate_builder_is_cached_per_search():
+    assert make_predicate_builder('bob', True) is make_predicate_builder('bob', True)
+    assert make_predicate_builder('bob', True) is not make_predicate_builder('bob', False)
+
+
+@pytest.mark.parametrize('data_type', sorted(SKIP_TYPES))
+@pytest.mark.parametrize('exact_match, case_sensitive, like_pattern', FLAGS)
+def test_unsearchable_types_are_always_skipped(data_type, exact_match, case_sensitive, like_pattern):
+    builder = make_predicate_builder('12', exact_match, case_sensitive, like_pattern)
+    assert builder('c', data_type) is None
+    assert builder('c', data_type.upper()) is None
+
+
+@pytest.mark.parametrize('data_type', sorted(STRING_TYPES))
+@pytest.mark.parametrize('exact_match, case_sensitive, like_pattern', FLAGS)
+def test_text_columns(data_type, exact_match, case_sensitive, like_pattern):
+    builder = make_predicate_builder('Åsa%', exact_match, case_sensitive, like_pattern)
+    where, params = builder('name', data_type)
+
+    if exact_match:
+        assert params == ('Åsa%',) and where.endswith(' = ?')
+    elif like_pattern:
+        assert params == ('Åsa%',) and where.endswith(' LIKE ?')
+    else:
+        assert params == ('%Åsa%',) and where.endswith(' LIKE ?')
+
+    if case_sensitive:
+        # No COLLATE, so the column is compared as stored
+        assert where.startswith('[name] ')
+    else:
+        # Converted to Unicode before collating, so no code page conversion
+        assert where.startswith('CAST([name] AS NVARCHAR(MAX)) COLLATE Latin1_General_CI_AS ')
+
+
+@pytest.mark.parametrize('case_sensitive', [False, True])
+def test_exact_numeric_search_compares_numeric_columns_natively(case_sensitive):
+    builder = make_predicate_builder('12', True, case_sensitive, False)
+
+    for data_type in INTEGER_TYPES:
+        assert builder('n', data_type) == ('[n] = ?', (12,))
+    for data_type in DECIMAL_TYPES:
+        assert builder('n', data_type) == ('[n] = ?', (Decimal('12'),))
+    assert builder('n', 'uniqueidentifier') is None
+
+
+def test_exact_fractional_search_skips_integer_columns():
+    builder = make_predicate_builder('12.5', True)
+
+    assert builder('n', 'int') is None
+    assert builder('n', 'decimal') == ('[n] = ?', (Decimal('12.5'),))
+
+
+@pytest.mark.parametrize('value', ['bob', 'NaN', 'Infinity'])
+def test_exact_text_search_skips_numeric_columns(value):
+    builder = make_predicate_builder(value, True)
+
+    for data_type in INTEGER_TYPES | DECIMAL_TYPES | {'uniqueidentifier'}:
+        assert builder('n', data_type) is None
+
+
+def test_partial_search_casts_numeric_columns_only_for_numeric_text():
+    numeric = make_predicate_builder('12')
+    text = make_predicate_builder('bob')
+
+    for data_type in INTEGER_TYPES | DECIMAL_TYPES:
+        assert numeric('n', data_type) == (
+            'CAST([n] AS NVARCHAR(MAX)) COLLATE Latin1_General_CI_AS LIKE ?', ('%12%',)
+        )
+        assert text('n', data_type) is None
+
+
+def test_date_columns_are_searched_only_for_iso_date_text():
+    date = make_predicate_builder('2024-01-01')
+    text = make_predicate_builder('Jan')
+
+    for data_type in ISO_DATE_TYPES:
+        assert date('d', data_type) == (
+            'CAST([d] AS NVARCHAR(MAX)) COLLATE Latin1_General_CI_AS LIKE ?', ('%2024-01-01%',)
+        )
+        assert text('d', data_type) is None
+    # datetime renders as 'Jan  1 2024 12:00AM', so it stays searchable as text
+    assert text('d', 'datetime') is not None
+
+
+def test_guid_columns():
+    assert make_predicate_builder(GUID, True)('g', 'uniqueidentifier') == (
+        '[g] = ?', (GUID.lower(),)
+    )
+    assert make_predicate_builder('c964ff')('g', 'uniqueidentifier') is not None
+    assert make_predicate_builder('bob')('g', 'uniqueidentifier') is None
+
+
+@pytest.mark.parametrize('exact_match, case_sensitive, like_pattern', FLAGS)
+def test_unknown_types_fall_back_to_text(exact_match, case_sensitive, like_pattern):
+    builder = make_predicate_builder('bob', exact_match, case_sensitive, like_pattern)
+    where, _ = builder('v', 'sql_variant')
+
+    assert where.startswith('CAST([v] AS NVARCHAR(MAX))')
+
+
+def test_type_names_are_case_insensitive():
+    builder = make_predicate_builder('12', True)
+    assert builder('n', 'INT') == builder('n', 'int')
+    assert builder('n', 'Image') is None
+
+
+def test_build_predicate_matches_the_builder():
+    builder = make_predicate_builder('bob', False, True, False)
+    assert search.build_predicate('c', 'varchar', 'bob', False, True, False) == builder('c', 'varchar')
@@ -0,0 +1,85 @@
+"""Tests for the result file writer in utils.py."""
+
+import json
+
+import pytest
+
+from TableFinder import utils
+from TableFinder.utils import save_results_to_file
+
+
+def make_result(i, sample='Åsa Öberg'):
+    return {
+        'table': f'[dbo].[kund{i}]',
+        'column': 'namn',
+        'data_type': 'nvarchar',
+        'match_count': 5,
+        'more_matches': True,
+        'sample_values': [sample, 'line\nbreak "quoted" \\ back', 'NULL'],
+    }
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def encoder(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the stdlib encoder."""
+    if request.param == 'orjson':
+        if utils.orjson is None:
+            pytest.skip('orjson is not installed')
+    else:
+        monkeypatch.setattr(utils, 'orjson', None)
+    return request.param
+
+
+@pytest.mark.parametrize('unicode', [False, True])
+@pytest.mark.parametrize('count', [0, 1, 3])
+def test_save_results_writes_valid_json(tmp_path, encoder, unicode, count):
+    path = tmp_path / 'results.json'
+    results = [make_result(i) for i in range(count)]
+
+    written = save_results_to_file(results, str(path), 'Åsa "x"', unicode=unicode)
+
+    raw = path.read_bytes()
+    assert written == len(raw)
+    data = json.loads(raw.decode('utf-8'))
+    assert data['search_value'] == 'Åsa "x"'
+    assert data['results'] == results
+    assert data['total_matches'] == count
+    assert list(data) == ['search_value', 'timestamp', 'results', 'total_matches']
+
+
+def test_save_results_escapes_non_ascii_by_default(tmp_path, encoder):
+    path = tmp_path / 'results.json'
+    save_results_to_file([make_result(0)], str(path), 'Å')
+
+    raw = path.read_bytes()
+    assert raw.isascii()
+    assert b'\\u00c5' in raw.lower()
+
+
+def test_save_results_writes_utf8_when_unicode(tmp_path, encoder):
+    path = tmp_path / 'results.json'
+    save_results_to_file([make_result(0)], str(path), 'Å', unicode=True)
+
+    assert 'Åsa Öberg'.encode('utf-8') in path.read_bytes()
+
+
+def test_save_results_streams_a_generator_across_chunks(tmp_path, encoder, monkeypatch):
+    monkeypatch.setattr(utils, 'WRITE_CHUNK_SIZE', 256)
+    path = tmp_path / 'results.json'
+
+    written = save_results_to_file((make_result(i) for i in range(50)), str(path), 'x')
+
+    raw = path.read_bytes()
+    assert written == len(raw)
+    data = json.loads(raw)
+    assert [r['table'] for r in data['results']] == [f'[dbo].[kund{i}]' for i in range(50)]
+    assert data['total_matches'] == 50
+
+
+def test_save_results_truncates_an_existing_file(tmp_path, encoder):
+    path = tmp_path / 'results.json'
+    path.write_bytes(b'x' * 100_000)
+
+    save_results_to_file([], str(path), 'x')
+
+    assert json.loads(path.read_bytes())['results'] == []
@@ -1,8 +1,81 @@
 """Utility functions for formatting and file operations."""
 
+import io
+import os
 import json
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import chain, islice
+from typing import List, Dict, Any, Iterable, Optional, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+# Separator line used around the console results header
+_SEPARATOR = '=' * 80
+
+# Shared encoders for result files; json.dumps would build a new one per call
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+_ASCII_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+# Fixed parts of the result file around the streamed records. An ISO
+# timestamp has no characters that need JSON escaping.
+_ENVELOPE_HEADER = '{{\n  "search_value": {search_value},\n  "timestamp": "{timestamp}",\n  "results": ['
+_ENVELOPE_FOOTER = '],\n  "total_matches": {total_matches}\n}}\n'
+
+# Encoded output is collected up to this many bytes before each os.write
+WRITE_CHUNK_SIZE = 64 * 1024
+
+
+def _dumps(obj: Any, unicode: bool = False) -> bytes:
+    """
+    Encode obj as JSON with two-space indentation.
+
+    Non-ASCII characters are escaped unless unicode is set, in which case
+    they are written as UTF-8.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        # orjson always writes UTF-8; only non-ASCII output needs re-encoding
+        if unicode or data.isascii():
+            return data
+    if unicode:
+        return _JSON_ENCODER.encode(obj).encode('utf-8')
+    return _ASCII_JSON_ENCODER.encode(obj).encode('ascii')
+
+
+def format_results_to(out: TextIO, results: List[Dict[str, Any]], search_value: str) -> None:
+    """
+    Write search results for console output to a text stream.
+
+    Each result is written as soon as it is formatted, so the full report is
+    never held in memory at once.
+
+    Args:
+        out: Text stream to write to (e.g., sys.stdout)
+        results: List of search result dictionaries
+        search_value: The value that was searched for
+    """
+    if not results:
+        out.write(f"\nNo matches found for '{search_value}'")
+        return
+
+    out.write(f"\n{_SEPARATOR}\nFound {len(results)} column(s) containing '{search_value}'\n{_SEPARATOR}\n")
+
+    for i, result in enumerate(results, 1):
+        match_count = f"{result['match_count']}+" if result.get('more_matches') else result['match_count']
+        lines = [
+            f"\n{i}. {result['table']}.{result['column']}\n"
+            f"   Data Type: {result['data_type']}\n"
+            f"   Match Count: {match_count}\n"
+            f"   Sample Values:"
+        ]
+        for val in result['sample_values']:
+            # Truncate long values; short ones (the common case) skip the slice
+            lines.append(f"     - {val}" if len(val) <= 100 else f"     - {val[:100]}...")
+        lines.append("")
+        out.write("\n".join(lines))
 
 
 def format_results(results: List[Dict[str, Any]], search_value: str) -> str:
@@ -16,47 +89,100 @@ def format_results(results: List[Dict[str, Any]], search_value: str) -> str:
     Returns:
         Formatted string for display
     """
-    if not results:
-        return f"\nNo matches found for '{search_value}'"
+    buf = io.StringIO()
+    format_results_to(buf, results, search_value)
+    return buf.getvalue()
 
-    output = [f"\n{'='*80}"]
-    output.append(f"Found {len(results)} column(s) containing '{search_value}'")
-    output.append(f"{'='*80}\n")
 
-    for i, result in enumerate(results, 1):
-        output.append(f"{i}. {result['table']}.{result['column']}")
-        output.append(f"   Data Type: {result['data_type']}")
-        output.append(f"   Match Count: {result['match_count']}")
-        output.append(f"   Sample Values:")
-        for val in result['sample_values']:
-            # Truncate long values
-            display_val = val[:100] + '...' if len(val) > 100 else val
-            output.append(f"     - {display_val}")
-        output.append("")
-
-    return "\n".join(output)
+def _write_all(fd: int, data) -> None:
+    """Write all of data to a raw file descriptor, retrying short writes."""
+    with memoryview(data) as view:
+        written = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
 
 
-def save_results_to_file(results: List[Dict[str, Any]], output_file: str, search_value: str) -> None:
+def save_results_to_file(
+    results: Iterable[Dict[str, Any]],
+    output_file: str,
+    search_value: str,
+    unicode: bool = False
+) -> int:
     """
     Save results to a JSON file.
 
+    Results are written one at a time as they are read from the iterable, so
+    a generator is never materialized; total_matches is written last. Each
+    record is encoded and written with a single call, rather than one write
+    per encoder chunk as json.dump does. orjson is used for encoding when it
+    is installed. Encoded records are gathered into WRITE_CHUNK_SIZE chunks
+    and written straight to the file descriptor, bypassing Python's buffered
+    file objects.
+
     Args:
-        results: List of search result dictionaries
+        results: Iterable of search result dictionaries
         output_file: Path to output file
         search_value: The value that was searched for
+        unicode: Write non-ASCII characters as UTF-8 instead of \\u escapes
+
+    Returns:
+        Number of bytes written
     """
-    output_data = {
-        'search_value': search_value,
-        'timestamp': datetime.now().isoformat(),
-        'total_matches': len(results),
-        'results': results
-    }
+    buf = bytearray(_ENVELOPE_HEADER.format(
+        search_value=(_JSON_ENCODER if unicode else _ASCII_JSON_ENCODER).encode(search_value),
+        timestamp=datetime.now().isoformat()
+    ).encode('utf-8'))
+
+    fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    written = 0
+    try:
+        total_matches = 0
+        for result in results:
+            # Re-indent the record to its nesting level in the envelope
+            buf += b',\n    ' if total_matches else b'\n    '
+            buf += _dumps(result, unicode).replace(b'\n', b'\n    ')
+            total_matches += 1
+            if len(buf) >= WRITE_CHUNK_SIZE:
+                _write_all(fd, buf)
+                written += len(buf)
+                buf.clear()
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if total_matches:
+            buf += b'\n  '
+        buf += _ENVELOPE_FOOTER.format(total_matches=total_matches).encode('utf-8')
+        _write_all(fd, buf)
+        written += len(buf)
+    finally:
+        os.close(fd)
 
-    print(f"\nResults saved to: {output_file}")
+    return written
+
+
+def parse_skip_tables(skip_tables: Optional[str]) -> Tuple[List[str], List[str]]:
+    """
+    Parse a comma-separated skip list into exact names and prefix patterns.
+
+    Entries containing '*' are treated as prefix patterns (e.g., 'konv_*'
+    skips every table starting with 'konv_'). Names are lowercased once here
+    and duplicates are dropped, keeping first-seen order.
+
+    Args:
+        skip_tables: Comma-separated list of tables to skip
+
+    Returns:
+        Tuple of (exact_names, prefixes)
+    """
+    skip_tables_list = []
+    skip_patterns = []
+    if skip_tables:
+        for t in skip_tables.split(','):
+            t = t.strip().lower()
+            if '*' in t:
+                # It's a pattern
+                skip_patterns.append(t.replace('*', ''))
+            else:
+                skip_tables_list.append(t)
+    return list(dict.fromkeys(skip_tables_list)), list(dict.fromkeys(skip_patterns))
 
 
 def filter_and_reorder_tables(
@@ -83,55 +209,49 @@ def filter_and_reorder_tables(
         'skipped_tables': []
     }
 
+    # Nothing to reorder or filter: skip the per-table work entirely
+    if not start_from and not skip_tables:
+        stats['final_count'] = len(tables)
+        return tables, stats
+
     # Parse skip tables list (supports wildcards like konv_*)
-    skip_tables_list = []
-    skip_patterns = []
+    skip_tables_list, skip_patterns = parse_skip_tables(skip_tables)
     if skip_tables:
-        for t in skip_tables.split(','):
-            t = t.strip().lower()
-            if '*' in t:
-                # It's a pattern
-                skip_patterns.append(t.replace('*', ''))
-            else:
-                skip_tables_list.append(t)
         stats['skipped_tables'] = skip_tables.split(',')
 
+    # Lowercased table names without schema, parallel to tables
+    basenames = [t.rsplit('.', 1)[-1].lower() for t in tables]
+    filtering = bool(skip_tables_list or skip_patterns)
+    ordered_tables, ordered_names = tables, basenames
+
     # Reorder tables based on start-from parameter
     if start_from:
-        start_table = start_from.lower()
-        start_index = None
-
-        # Find the start table
-        for i, table in enumerate(tables):
-            table_name_only = table.split('.')[-1].lower()
-            if table_name_only == start_table:
-                start_index = i
-                break
+        # Find the first table with that name (a single C-level scan)
+        try:
+            start_index = basenames.index(start_from.lower())
+        except ValueError:
+            start_index = None
 
         if start_index is not None:
             # Reorder: start table first, then rest of tables, then tables before start
-            reordered_tables = tables[start_index:] + tables[:start_index]
-            tables = reordered_tables
+            if filtering:
+                # Rotate lazily; the filter below builds the only new list
+                ordered_tables = chain(islice(tables, start_index, None), islice(tables, start_index))
+                ordered_names = chain(islice(basenames, start_index, None), islice(basenames, start_index))
+            else:
+                tables = tables[start_index:] + tables[:start_index]
             stats['started_from'] = start_from
 
-    # Filter out skipped tables
-    if skip_tables_list or skip_patterns:
+    # Filter out skipped tables; exact names are a set lookup and all
+    # prefixes are checked by a single startswith() call
+    if filtering:
         original_count = len(tables)
-        filtered_tables = []
-        for t in tables:
-            table_name_only = t.split('.')[-1].lower()
-            # Check exact match
-            if table_name_only in skip_tables_list:
-                continue
-            # Check pattern match
-            skip_table = False
-            for pattern in skip_patterns:
-                if table_name_only.startswith(pattern):
-                    skip_table = True
-                    break
-            if not skip_table:
-                filtered_tables.append(t)
-        tables = filtered_tables
+        skip_names = frozenset(skip_tables_list)
+        skip_prefixes = tuple(skip_patterns)
+        tables = [
+            t for t, name in zip(ordered_tables, ordered_names)
+            if name not in skip_names and not name.startswith(skip_prefixes)
+        ]
         stats['skipped_count'] = original_count - len(tables)
 
     stats['final_count'] = len(tables)